@@ -1,5 +1,5 @@
 from machine import Pin, SPI
-from waveshare2in7 import BLACK, EPD, WHITE
+from waveshare2in7 import BLACK, BUSY, EPD, WHITE
 import time
 
 # WaveShare 2.7" E-Paper Display to ESP-WROOM-32
@@ -11,17 +11,33 @@ import time
 # DC      → GPIO 2 (or any available GPIO)
 # RST     → GPIO 4 (or any available GPIO)
 # BUSY    → GPIO 15 (or any available GPIO)
-spi = SPI(2, baudrate=4000000, polarity=0, phase=0, sck=Pin(18), mosi=Pin(23))
+spi = SPI(2, baudrate=20_000_000, polarity=0, phase=0, sck=Pin(18), mosi=Pin(23))
 cs = Pin(5, Pin.OUT)
 dc = Pin(2, Pin.OUT)
 rst = Pin(4, Pin.OUT)
 busy = Pin(15, Pin.IN)
 
+# Driver logging writes to the UART on every refresh step; enable only when debugging
+DEBUG = False
+
+
+def init_display(epd):
+    """Initialize the display, falling back to 10 MHz SPI if it never goes idle"""
+    epd.init()
+    deadline = time.ticks_add(time.ticks_ms(), 2000)
+    while epd.busy.value() == BUSY:
+        if time.ticks_diff(deadline, time.ticks_ms()) <= 0:
+            print("Display still busy, retrying at 10 MHz")
+            spi.init(baudrate=10_000_000)
+            epd.init()
+            return
+        time.sleep_ms(10)
+
 
 def demo():
     print("Hello!")
-    epd = EPD(spi, cs, dc, rst, busy, orientation=1, debug=True)
-    epd.init()
+    epd = EPD(spi, cs, dc, rst, busy, orientation=1, debug=DEBUG)
+    init_display(epd)
     epd.fill(WHITE)
     epd.draw_bmp("david.bmp", 0, 0)
     epd.display()
@@ -29,8 +45,8 @@ def demo():
 
     for orientation in [0, 2, 3, 1]:
         print(f"Orientation: {orientation}")
-        epd = EPD(spi, cs, dc, rst, busy, orientation=orientation, debug=True)
-        epd.init()
+        epd = EPD(spi, cs, dc, rst, busy, orientation=orientation, debug=DEBUG)
+        init_display(epd)
         epd.fill(WHITE)  # Fill frame buffer with white
         epd.fill_rect(10, 10, 20, 20, BLACK)
         epd.text("Hello World!", 10, 40, BLACK)
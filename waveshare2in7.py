@@ -7,6 +7,7 @@ Base on https://github.com/waveshareteam/e-Paper/tree/master/Arduino/epd2in7b_V2
 from micropython import const
 from time import sleep_ms, ticks_ms
 import framebuf
+import micropython
 import struct
 
 WHITE = const(0xFF)
@@ -15,6 +16,8 @@ BLACK = const(0x00)
 # Display resolution (portrait mode) - corrected to match Arduino
 EPD_WIDTH = const(176)
 EPD_HEIGHT = const(264)
+# Bytes of display RAM, identical for every orientation
+_BUF_SIZE = const((EPD_WIDTH * EPD_HEIGHT + 7) // 8)
 
 # Display commands
 PANEL_SETTING = const(0x00)
@@ -36,9 +39,60 @@ VCM_DC_SETTING_REGISTER = const(0x82)
 POWER_OPTIMIZATION = const(0xF8)
 
 BUSY = const(0)  # 0=busy, 1=idle
-
-# Optimization constants
-SPI_BATCH_SIZE = const(64)  # Optimal batch size for SPI transfers
+BUSY_POLL_MS = const(5)  # BUSY polling interval; bounds the wait's overshoot
+
+# Frame buffer packing per orientation, chosen so the controller's RAM scan
+# order (see _RAM_SCAN) performs the rotation instead of the CPU
+_FORMATS = (
+    framebuf.MONO_HLSB,  # 0: portrait
+    framebuf.MONO_VLSB,  # 1: landscape
+    framebuf.MONO_HMSB,  # 2: portrait upside down
+    framebuf.MONO_VLSB,  # 3: landscape upside down
+)
+
+# Register setup sent after soft reset, as (command, data) pairs
+_INIT_SEQUENCE = (
+    (0x01, b"\xB7\x01\x00"),  # Driver output control
+    (0x11, b"\x03"),  # Data entry mode - corrected to match Arduino
+    (0x44, b"\x00\x15"),  # RAM X start/end: 0x15-->(21+1)*8=176 (from Arduino)
+    (0x45, b"\x00\x00\x07\x01"),  # RAM Y start/end: 0x0107-->(263+1)=264
+    (0x3C, b"\x05"),  # Border waveform control
+    (0x18, b"\x80"),  # Temperature sensor control
+    (0x22, b"\xB1"),  # Display update control - power management
+    (0x20, None),  # Master activation
+    (0x4E, b"\x00"),  # RAM X address counter
+    (0x4F, b"\x00\x00"),  # RAM Y address counter
+)
+
+# RAM scan per orientation: data entry mode, X and Y address counter start.
+# Entry mode bit 2 scans X-first (0) or Y-first (1); bits 1/0 make Y/X
+# increment (1) or decrement (0)
+_RAM_SCAN = (
+    (b"\x03", b"\x00", b"\xB7\x01"),  # 0: X first, X+ Y+
+    (b"\x05", b"\x00", b"\x07\x01"),  # 1: Y first, X+ Y-
+    (b"\x00", b"\x15", b"\x07\x01"),  # 2: X first, X- Y-
+    (b"\x06", b"\x15", b"\x00\x00"),  # 3: Y first, X- Y+
+)
+
+
+def _reverse_bits(value):
+    result = 0
+    for _ in range(8):
+        result = (result << 1) | (value & 1)
+        value >>= 1
+    return result
+
+
+# Bit-reversal lookup table, built once at import
+_BITREV = bytes(_reverse_bits(i) for i in range(256))
+
+
+@micropython.viper
+def _flip_bits(src: ptr8, offset: int, dst: ptr8, n: int):
+    """Reverse the bit order of n bytes from src[offset:] into dst via _BITREV"""
+    lut = ptr8(_BITREV)
+    for i in range(n):
+        dst[i] = lut[src[offset + i]]
 
 
 class EPD:
@@ -48,7 +102,6 @@ class EPD:
         self.dc = dc
         self.rst = rst
         self.busy = busy
-        self.orientation = orientation
         self.debug = debug
 
         # Initialize pins properly
@@ -57,97 +110,80 @@ class EPD:
         self.rst.init(self.rst.OUT, value=0)
         self.busy.init(self.busy.IN)
 
-        # Always use original portrait dimensions for the frame buffer
-        # The display hardware expects data in portrait format regardless of orientation
-        buffer_size = (self.width * self.height + 7) // 8
-        self.buffer = bytearray(buffer_size)
-        self.framebuf = framebuf.FrameBuffer(
-            self.buffer, self.width, self.height, framebuf.MONO_HLSB
-        )
-
-    def _log(self, message):
+        # The buffer holds exactly one panel's worth of RAM in every
+        # orientation; set_orientation only changes how pixels are packed
+        self.buffer = bytearray(_BUF_SIZE)
+        # Zero-copy view of the buffer used as the SPI source
+        self._mv = memoryview(self.buffer)
+        # Scratch byte for command writes, avoiding a heap allocation per command
+        self._cmd_buf = bytearray(1)
+        # One landscape band of bit-flipped bytes, allocated by set_orientation
+        # only when the orientation needs it
+        self._stripe = None
+        # Set by the BUSY pin IRQ, created on first async wait
+        self._idle_flag = None
+        self.set_orientation(orientation)
+
+    def _log(self, message, *args):
+        # Arguments are only formatted when debugging, so release builds
+        # skip both the string building and the blocking UART write
         if self.debug:
-            print(f"[EPD] {ticks_ms()}ms: {message}")
-
-    @property
-    def width(self):
-        """Get display width based on current orientation"""
-        return EPD_WIDTH if self.orientation % 2 == 0 else EPD_HEIGHT
-
-    @property
-    def height(self):
-        """Get display height based on current orientation"""
-        return EPD_HEIGHT if self.orientation % 2 == 0 else EPD_WIDTH
+            print(f"[EPD] {ticks_ms()}ms: {message.format(*args)}")
 
     def set_orientation(self, orientation):
         """Change orientation without reinitializing"""
-        self._log(f"Setting orientation to {orientation}")
+        self._log("Setting orientation to {}", orientation)
         self.orientation = orientation
+        # Plain attributes rather than properties, since drawing code reads them often
+        self.width = EPD_WIDTH if orientation % 2 == 0 else EPD_HEIGHT
+        self.height = EPD_HEIGHT if orientation % 2 == 0 else EPD_WIDTH
+        self.framebuf = framebuf.FrameBuffer(
+            self.buffer, self.width, self.height, _FORMATS[orientation]
+        )
+        # Primitives with no default color are bound straight to the framebuffer
+        self.fill = self.framebuf.fill
+        self.pixel = self.framebuf.pixel
+        # Resolved once here so display_frame doesn't branch or look up tables
+        self._send = self._send_flipped if orientation == 1 else self._data
+        if orientation == 1 and self._stripe is None:
+            # Allocated once and reused, so refreshes don't allocate on the heap
+            self._stripe = bytearray(EPD_HEIGHT)
+        self._scan_mode, self._scan_x, self._scan_y = _RAM_SCAN[orientation]
 
     def _command(self, command, data=None):
-        """Send command to display"""
-        self.dc(0)
+        """Send command and optional data to display in one CS-framed transaction"""
         self.cs(0)
-        self.spi.write(bytearray([command]))
-        self.cs(1)
+        self.dc(0)
+        self._cmd_buf[0] = command
+        self.spi.write(self._cmd_buf)
         if data is not None:
-            self._data(data)
-
-    def _data(self, data):
-        """Send data to display - optimized for single byte"""
-        self.dc(1)
-        self.cs(0)
-        if isinstance(data, int):
-            self.spi.write(bytearray([data]))
-        else:
+            self.dc(1)
             self.spi.write(data)
         self.cs(1)
 
-    def _data_batch(self, data_list):
-        """Send data in batches for better SPI performance"""
-        if not data_list:
-            return
-
+    def _data(self, data):
+        """Send a bytes-like buffer to display in a single SPI transaction"""
         self.dc(1)
         self.cs(0)
-
-        # Convert list to bytearray for efficient transfer
-        if isinstance(data_list, list):
-            data_bytes = bytearray(data_list)
-        else:
-            data_bytes = data_list
-
-        self.spi.write(data_bytes)
+        self.spi.write(data)
         self.cs(1)
 
-    def _clear_display_fast(self):
-        """Fast clear using display commands instead of frame buffer"""
-        self._log("Fast clearing display")
+    def _fill_display(self, color):
+        """Fill frame buffer and display RAM with a uniform color"""
+        # A uniform buffer looks the same in every orientation, so skip the
+        # transform and stream the frame buffer straight into RAM
+        self.framebuf.fill(color)
 
         # Set RAM address counters
-        self._command(0x4E)
-        self._data(0x00)
-        self._command(0x4F)
-        self._data(0x00)
-        self._data(0x00)
+        self._command(0x4E, b"\x00")
+        self._command(0x4F, b"\x00\x00")
 
         # Write RAM for black/white
         self._command(0x24)
+        self._data(self._mv)
 
-        # Send all white bytes in batches
-        buffer_size = len(self.buffer)
-        batch_size = SPI_BATCH_SIZE
-        white_data = [0xFF] * batch_size
-
-        for i in range(0, buffer_size, batch_size):
-            end = min(i + batch_size, buffer_size)
-            if end - i == batch_size:
-                # Full batch
-                self._data_batch(white_data)
-            else:
-                # Partial batch
-                partial_data = [0xFF] * (end - i)
-                self._data_batch(partial_data)
+        self._refresh()
+        self.wait_until_idle()
 
     def init(self):
         """Initialize display using corrected sequence"""
@@ -165,41 +201,8 @@ class EPD:
         self._command(0x12)  # Soft reset
         sleep_ms(10)
 
-        self._command(0x01)  # Driver output control
-        self._data(0xB7)
-        self._data(0x01)
-        self._data(0x00)
-
-        self._command(0x11)  # Data entry mode
-        self._data(0x03)  # Corrected to match Arduino
-
-        self._command(0x44)  # Set RAM X address start/end
-        self._data(0x00)
-        self._data(0x15)  # 0x15-->(21+1)*8=176 (from Arduino)
-
-        self._command(0x45)  # Set RAM Y address start/end
-        self._data(0x00)
-        self._data(0x00)
-        self._data(0x07)  # 0x0107-->(263+1)=264
-        self._data(0x01)
-
-        self._command(0x3C)  # Border waveform control
-        self._data(0x05)
-
-        self._command(0x18)  # Temperature sensor control
-        self._data(0x80)
-
-        # Power management
-        self._command(0x22)  # Display update control
-        self._data(0xB1)
-        self._command(0x20)
-
-        # Set RAM address counters
-        self._command(0x4E)  # Set RAM X address counter
-        self._data(0x00)
-        self._command(0x4F)  # Set RAM Y address counter
-        self._data(0x00)
-        self._data(0x00)
+        for command, data in _INIT_SEQUENCE:
+            self._command(command, data)
 
         self._log("Display initialized")
 
@@ -207,210 +210,81 @@ class EPD:
         """Wait until display is not busy"""
         self._log("Waiting until display is not busy...")
         while self.busy.value() == BUSY:
-            sleep_ms(100)
+            sleep_ms(BUSY_POLL_MS)
         self._log("Display is not busy")
 
-    def display_frame(self, frame_buffer):
-        """Display frame buffer with proper orientation handling and optimized SPI"""
-        self._log("Displaying frame")
+    async def wait_until_idle_async(self):
+        """Wait until display is not busy without blocking the event loop"""
+        self._log("Waiting until display is not busy...")
+        if self._idle_flag is None:
+            import asyncio
+
+            # BUSY rises when the panel goes idle
+            self._idle_flag = asyncio.ThreadSafeFlag()
+            self.busy.irq(
+                trigger=self.busy.IRQ_RISING, handler=lambda pin: self._idle_flag.set()
+            )
+        while self.busy.value() == BUSY:
+            await self._idle_flag.wait()
+        self._log("Display is not busy")
 
-        # Clear any previous data
-        self._command(0x24)  # Write RAM for black/white
-        for i in range(0, len(frame_buffer)):
-            self._data(0xFF)  # Clear to white first
+    def _refresh(self):
+        """Start a full refresh from display RAM"""
+        self._log("Display update control")
+        self._command(0x22, b"\xC7")
+        self._command(0x20)  # Master activation
 
-        # Set RAM X address counter
-        self._command(0x4E)
-        self._data(0x00)
+    def display_frame(self, frame_buffer):
+        """Display a frame buffer packed like self.framebuf for the current orientation"""
+        self._write_frame(frame_buffer)
+        self._refresh()
+        self.wait_until_idle()
+
+    def _write_frame(self, frame_buffer):
+        """Write frame buffer to display RAM in the current orientation"""
+        self._log("Displaying frame")
 
-        # Set RAM Y address counter
-        self._command(0x4F)
-        self._data(0xB7)
-        self._data(0x01)
+        self._command(0x11, self._scan_mode)  # Data entry mode
+        self._command(0x4E, self._scan_x)  # Set RAM X address counter
+        self._command(0x4F, self._scan_y)  # Set RAM Y address counter
 
         # Write RAM for black/white
         self._command(0x24)
-
-        # Get original display dimensions (portrait)
-        orig_width = EPD_WIDTH
-
-        if self.orientation == 0:
-            self._log("Displaying frame in portrait mode")
-            # Default portrait mode - send data in batches
-            self._send_buffer_batched(frame_buffer)
-
-        elif self.orientation == 2:
-            self._log("Displaying frame in portrait upside down mode")
-            # Portrait upside down - reverse byte order and flip bits
-            flipped_buffer = bytearray(len(frame_buffer))
-            for i in range(len(frame_buffer)):
-                # Flip bits in each byte (reverse bit order)
-                byte_val = frame_buffer[i]
-                flipped_byte = 0
-                for bit in range(8):
-                    if byte_val & (1 << bit):
-                        flipped_byte |= 1 << (7 - bit)
-                flipped_buffer[len(frame_buffer) - 1 - i] = flipped_byte
-            self._send_buffer_batched(flipped_buffer)
-
-        elif self.orientation == 1:
-            self._log("Displaying frame in landscape mode")
-            rotated_buffer = self._rotate_buffer_90_cw(frame_buffer)
-            self._send_buffer_batched(rotated_buffer)
-
-        elif self.orientation == 3:
-            self._log("Displaying frame in landscape upside down mode")
-            rotated_buffer = self._rotate_buffer_270_cw(frame_buffer)
-            self._send_buffer_batched(rotated_buffer)
-
-        # Display update control
-        self._log("Display update control")
-        self._command(0x22)
-        self._data(0xC7)
-        self._command(0x20)  # Master activation
-        self.wait_until_idle()
-
-    def _send_buffer_batched(self, buffer):
-        """Send buffer data in optimized batches"""
-        batch_size = SPI_BATCH_SIZE
-        for i in range(0, len(buffer), batch_size):
-            end = min(i + batch_size, len(buffer))
-            batch_data = buffer[i:end]
-            self._data_batch(batch_data)
-
-    def _rotate_buffer_90_cw(self, logical_buffer):
-        """Rotate buffer 90° clockwise with optimized algorithm"""
-        # Physical buffer for actual display dimensions (176x264)
-        physical_buffer_size = (EPD_WIDTH * EPD_HEIGHT + 7) // 8
-        physical_buffer = bytearray(physical_buffer_size)
-
-        def logical_to_physical(x, y):
-            # Rotate 90° clockwise: logical (264w×176h) -> physical (176w×264h)
-            # For 90° clockwise: (x,y) -> (y, width-1-x)
-            new_x = y
-            new_y = self.width - 1 - x  # self.width is 264 in landscape mode
-            return new_x, new_y
-
-        def get_logical_pixel(x, y):
-            # Get pixel from logical buffer (landscape: 264×176)
-            bit_index = y * self.width + x
-            byte_index = bit_index // 8
-            bit_offset = bit_index % 8
-            return (logical_buffer[byte_index] >> (7 - bit_offset)) & 1
-
-        def set_physical_pixel(x, y, value):
-            # Set pixel in physical buffer (portrait: 176×264)
-            bit_index = y * EPD_WIDTH + x
-            byte_index = bit_index // 8
-            bit_offset = bit_index % 8
-            if value:
-                physical_buffer[byte_index] |= 1 << (7 - bit_offset)
-            else:
-                physical_buffer[byte_index] &= ~(1 << (7 - bit_offset))
-
-        # Transform from logical coordinates to physical coordinates
-        self._log("Transforming coordinates")
-        for ly in range(self.height):  # logical height (176)
-            for lx in range(self.width):  # logical width (264)
-                px, py = logical_to_physical(lx, ly)
-                set_physical_pixel(px, py, get_logical_pixel(lx, ly))
-
-        return physical_buffer
-
-    def _rotate_buffer_270_cw(self, logical_buffer):
-        """Rotate buffer 270° clockwise (90° counterclockwise) with optimized algorithm"""
-        # Physical buffer for actual display dimensions (176x264)
-        physical_buffer_size = (EPD_WIDTH * EPD_HEIGHT + 7) // 8
-        physical_buffer = bytearray(physical_buffer_size)
-
-        def logical_to_physical(x, y):
-            # Rotate 270° clockwise: logical (264w×176h) -> physical (176w×264h)
-            # For 270° clockwise: (x,y) -> (height-1-y, x)
-            new_x = self.height - 1 - y  # self.height is 176 in landscape mode
-            new_y = x
-            return new_x, new_y
-
-        def get_logical_pixel(x, y):
-            # Get pixel from logical buffer (landscape: 264×176)
-            bit_index = y * self.width + x
-            byte_index = bit_index // 8
-            bit_offset = bit_index % 8
-            return (logical_buffer[byte_index] >> (7 - bit_offset)) & 1
-
-        def set_physical_pixel(x, y, value):
-            # Set pixel in physical buffer (portrait: 176×264)
-            bit_index = y * EPD_WIDTH + x
-            byte_index = bit_index // 8
-            bit_offset = bit_index % 8
-            if value:
-                physical_buffer[byte_index] |= 1 << (7 - bit_offset)
-            else:
-                physical_buffer[byte_index] &= ~(1 << (7 - bit_offset))
-
-        # Transform from logical coordinates to physical coordinates
-        self._log("Transforming coordinates")
-        for ly in range(self.height):  # logical height (176)
-            for lx in range(self.width):  # logical width (264)
-                px, py = logical_to_physical(lx, ly)
-                set_physical_pixel(px, py, get_logical_pixel(lx, ly))
-
-        return physical_buffer
+        self._send(frame_buffer)
+
+    def _send_flipped(self, frame_buffer):
+        """Send MONO_VLSB bytes flipped to the panel's leftmost-pixel-in-MSB order"""
+        # Flip one 8-pixel band at a time and send it straight away, instead
+        # of staging the whole frame in a second full-size buffer
+        stripe = self._stripe
+        size = len(stripe)
+        write = self.spi.write
+        self.dc(1)
+        self.cs(0)
+        for offset in range(0, len(frame_buffer), size):
+            _flip_bits(frame_buffer, offset, stripe, size)
+            write(stripe)
+        self.cs(1)
 
     def display(self):
         """Display current frame buffer"""
-        self.display_frame(self.buffer)
+        self.display_frame(self._mv)
+
+    async def display_async(self):
+        """Display current frame buffer, yielding to other tasks during the refresh"""
+        self._write_frame(self._mv)
+        self._refresh()
+        await self.wait_until_idle_async()
 
     def clear(self):
         """Clear display to white using optimized method"""
         self._log("Clearing display")
-        self._clear_display_fast()
-
-        # Display update control
-        self._command(0x22)
-        self._data(0xC7)
-        self._command(0x20)  # Master activation
-        self.wait_until_idle()
-
-        # Also clear the frame buffer
-        self.framebuf.fill(0xFF)
+        self._fill_display(WHITE)
 
     def fill_black(self):
         """Fill display with black using optimized method"""
         self._log("Filling display with black")
-
-        # Set RAM address counters
-        self._command(0x4E)
-        self._data(0x00)
-        self._command(0x4F)
-        self._data(0x00)
-        self._data(0x00)
-
-        # Write RAM for black/white
-        self._command(0x24)
-
-        # Send all black bytes in batches
-        buffer_size = len(self.buffer)
-        batch_size = SPI_BATCH_SIZE
-        black_data = [0x00] * batch_size
-
-        for i in range(0, buffer_size, batch_size):
-            end = min(i + batch_size, buffer_size)
-            if end - i == batch_size:
-                # Full batch
-                self._data_batch(black_data)
-            else:
-                # Partial batch
-                partial_data = [0x00] * (end - i)
-                self._data_batch(partial_data)
-
-        # Display update control
-        self._command(0x22)
-        self._data(0xC7)
-        self._command(0x20)  # Master activation
-        self.wait_until_idle()
-
-        # Also fill the frame buffer
-        self.framebuf.fill(0x00)
+        self._fill_display(BLACK)
 
     def sleep(self):
         """Put display into deep sleep mode"""
@@ -419,40 +293,16 @@ class EPD:
     def reset_display(self):
         """Reset display and clear to white"""
         self._log("Resetting display")
-
-        # Hardware reset
-        self.rst(1)
-        sleep_ms(200)
-        self.rst(0)
-        sleep_ms(2)
-        self.rst(1)
-        sleep_ms(200)
-
-        # Re-initialize
+        # init() performs the hardware reset
         self.init()
-
-        # Clear to white
         self.clear()
-
         self._log("Display reset complete")
 
-    def force_clear(self):
-        """Force clear to white using optimized method"""
-        self._log("Force clearing display")
-        self.clear()
-        self._log("Force clear complete")
-
-    def clear_large_range(self):
-        """Clear to white (same as regular clear)"""
-        self._log("Clearing display")
-        self.clear()
-        self._log("Clear complete")
+    # Older names for clear(), kept for compatibility
+    force_clear = clear
+    clear_large_range = clear
 
     # Graphics methods that use the framebuffer
-    def fill(self, color):
-        """Fill frame buffer with color"""
-        self.framebuf.fill(color)
-
     def text(self, string, x, y, color=0x00):
         """Draw text"""
         self.framebuf.text(string, x, y, color)
@@ -477,22 +327,36 @@ class EPD:
         """Draw horizontal line"""
         self.framebuf.hline(x, y, w, color)
 
+    def _circle_clipped(self, x, y, radius):
+        """Check whether a circle is degenerate or entirely off-screen"""
+        return (
+            radius < 0
+            or x + radius < 0
+            or y + radius < 0
+            or x - radius >= self.width
+            or y - radius >= self.height
+        )
+
     def circle(self, x, y, radius, color=0x00):
         """Draw a circle using optimized Bresenham's algorithm"""
+        if self._circle_clipped(x, y, radius):
+            return
         x0, y0 = x, y
         x1, y1 = radius, 0
         err = 0
+        # Bound once: saves two attribute lookups on each of the 8 calls per step
+        pixel = self.framebuf.pixel
 
         while x1 >= y1:
             # Draw 8 symmetric points at once
-            self.framebuf.pixel(x0 + x1, y0 + y1, color)
-            self.framebuf.pixel(x0 + y1, y0 + x1, color)
-            self.framebuf.pixel(x0 - y1, y0 + x1, color)
-            self.framebuf.pixel(x0 - x1, y0 + y1, color)
-            self.framebuf.pixel(x0 - x1, y0 - y1, color)
-            self.framebuf.pixel(x0 - y1, y0 - x1, color)
-            self.framebuf.pixel(x0 + y1, y0 - x1, color)
-            self.framebuf.pixel(x0 + x1, y0 - y1, color)
+            pixel(x0 + x1, y0 + y1, color)
+            pixel(x0 + y1, y0 + x1, color)
+            pixel(x0 - y1, y0 + x1, color)
+            pixel(x0 - x1, y0 + y1, color)
+            pixel(x0 - x1, y0 - y1, color)
+            pixel(x0 - y1, y0 - x1, color)
+            pixel(x0 + y1, y0 - x1, color)
+            pixel(x0 + x1, y0 - y1, color)
 
             if err <= 0:
                 y1 += 1
@@ -501,22 +365,45 @@ class EPD:
                 x1 -= 1
                 err -= 2 * x1 + 1
 
+    def fill_circle(self, x, y, radius, color=0x00):
+        """Draw a filled circle as one horizontal span per scanline"""
+        if self._circle_clipped(x, y, radius):
+            return
+        x0, y0 = x, y
+        x1, y1 = radius, 0
+        err = 0
+        hline = self.framebuf.hline
+
+        while x1 >= y1:
+            # Wide spans around the center rows
+            hline(x0 - x1, y0 + y1, 2 * x1 + 1, color)
+            if y1:
+                hline(x0 - x1, y0 - y1, 2 * x1 + 1, color)
+
+            prev_x, prev_y = x1, y1
+            if err <= 0:
+                y1 += 1
+                err += 2 * y1 + 1
+            if err > 0:
+                x1 -= 1
+                err -= 2 * x1 + 1
+
+            # Narrow spans at the top and bottom, once each row is complete
+            if x1 != prev_x and prev_x > prev_y:
+                hline(x0 - prev_y, y0 + prev_x, 2 * prev_y + 1, color)
+                hline(x0 - prev_y, y0 - prev_x, 2 * prev_y + 1, color)
+
     def _load_bmp(self, filename):
         """Load a 1-bit BMP file and return framebuffer data"""
         with open(filename, "rb") as f:
-            # Read BMP header (14 bytes)
-            header = f.read(14)
-            if header[0:2] != b"BM":
+            # File header (14 bytes) and BITMAPINFOHEADER (40 bytes) in one read
+            header = f.read(54)
+            if len(header) < 54:
                 raise ValueError("Not a BMP file")
-
-            # Get offset to pixel data
-            pixel_offset = struct.unpack("<I", header[10:14])[0]
-
-            # Read DIB header (40 bytes for BITMAPINFOHEADER)
-            dib_header = f.read(40)
-            width = struct.unpack("<I", dib_header[4:8])[0]
-            height = struct.unpack("<I", dib_header[8:12])[0]
-            bits_per_pixel = struct.unpack("<H", dib_header[14:16])[0]
+            magic, _, _, _, pixel_offset = struct.unpack_from("<2sIHHI", header, 0)
+            if magic != b"BM":
+                raise ValueError("Not a BMP file")
+            width, height, _, bits_per_pixel = struct.unpack_from("<IIHH", header, 18)
 
             if bits_per_pixel != 1:
                 raise ValueError("Not a 1-bit BMP")
@@ -531,15 +418,21 @@ class EPD:
             # Seek to pixel data
             f.seek(pixel_offset)
 
+            # Reused for every row; only the first fb_width_bytes carry pixels
+            row_buf = bytearray(row_size)
+            row_pixels = memoryview(row_buf)[:fb_width_bytes]
+
             # Read pixel data (BMP stores bottom-to-top)
             for y in range(height - 1, -1, -1):
-                row_data = f.read(row_size)
+                n = f.readinto(row_buf)
 
-                # Copy relevant bytes to framebuffer
-                for x_byte in range(fb_width_bytes):
-                    if x_byte < len(row_data):
-                        # BMP is LSB first, framebuffer might need adjustment
-                        fb_data[y * fb_width_bytes + x_byte] = row_data[x_byte]
+                # Copy relevant bytes to framebuffer, dropping the row padding
+                start = y * fb_width_bytes
+                if n < fb_width_bytes:
+                    # Truncated file: keep the partial row and stop
+                    fb_data[start : start + n] = row_pixels[:n]
+                    break
+                fb_data[start : start + fb_width_bytes] = row_pixels
 
             # Create framebuffer object
             fb = framebuf.FrameBuffer(fb_data, width, height, framebuf.MONO_HLSB)
@@ -560,21 +453,21 @@ class EPD:
                 or y + bmp_height > self.height
             ):
                 self._log(
-                    f"BMP at ({x},{y}) with size {bmp_width}x{bmp_height} would be out of bounds"
+                    "BMP at ({},{}) with size {}x{} would be out of bounds",
+                    x,
+                    y,
+                    bmp_width,
+                    bmp_height,
                 )
                 return False
 
-            # Copy BMP pixels to the main framebuffer
-            for by in range(bmp_height):
-                for bx in range(bmp_width):
-                    # Get pixel from BMP framebuffer
-                    pixel = bmp_fb.pixel(bx, by)
-                    # Set pixel in main framebuffer (invert if needed for your display)
-                    self.framebuf.pixel(x + bx, y + by, pixel)
+            # Copy BMP pixels to the main framebuffer in C; blit converts from
+            # the BMP's MONO_HLSB to whatever packing the orientation uses
+            self.framebuf.blit(bmp_fb, x, y)
 
-            self._log(f"Displayed BMP {filename} at ({x},{y})")
+            self._log("Displayed BMP {} at ({},{})", filename, x, y)
             return True
 
         except Exception as e:
-            self._log(f"Error displaying BMP {filename}: {e}")
+            self._log("Error displaying BMP {}: {}", filename, e)
             return False